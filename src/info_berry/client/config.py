@@ -2,10 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Type
 
 import yaml
 
+try:
+    # libyaml-backed parser, several times faster than the pure-Python one
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 from .content import Content, HtmlFileContent, ImageContent, UrlContent, VideoContent
 
 
@@ -30,24 +36,32 @@ class AppConfig:
     contents: List[Content]
 
 
+_KIND_TO_CLS: Dict[str, Type[Content]] = {
+    "url": UrlContent,
+    "html": HtmlFileContent,
+    "image": ImageContent,
+    "video": VideoContent,
+}
+
+
 def _to_content(obj: dict) -> Content:
     t = (obj.get("type") or "url").lower()
-    src = obj["source"]
-    dur = obj.get("duration")
-    if t == "url":
-        return UrlContent(id=Content.new_id(), source=src, duration=dur)
-    if t == "html":
-        return HtmlFileContent(id=Content.new_id(), source=src, duration=dur)
-    if t == "image":
-        return ImageContent(id=Content.new_id(), source=src, duration=dur)
-    if t == "video":
-        return VideoContent(id=Content.new_id(), source=src, duration=dur)
     # Default to URL if unknown
-    return UrlContent(id=Content.new_id(), source=src, duration=dur)
+    cls = _KIND_TO_CLS.get(t, UrlContent)
+    return cls(
+        id=Content.new_id(),
+        source=obj["source"],
+        duration=obj.get("duration"),
+        footer=bool(obj.get("footer", True)),
+    )
 
 
 def load_config(path: str) -> AppConfig:
-    data = yaml.safe_load(Path(path).read_text()) or {}
+    return parse_config(yaml.load(Path(path).read_text(), Loader=_SafeLoader) or {})
+
+
+def parse_config(data: dict) -> AppConfig:
+    """Build an AppConfig from an already-parsed config mapping."""
     display = data.get("display", {}) or {}
     behavior = data.get("behavior", {}) or {}
     items = data.get("content") or data.get("urls") or []
@@ -1,71 +1,58 @@
 from __future__ import annotations
 
+import atexit
+import functools
 import html
+import itertools
+import os
+import platform
 import tempfile
-import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import ClassVar, List, Literal, Optional, Tuple
+from typing import ClassVar, Dict, List, Literal, Optional, Sequence, Set, Tuple
+from urllib.parse import quote
 
 ContentType = Literal["url", "html", "image", "video", "error"]
+# Identity of a content item across config reloads: (kind, source, footer)
+ContentKey = Tuple[str, str, bool]
 
-@dataclass(frozen=True)
-class Content:
-    """Base content class with rendering logic."""
-    id: str
-    source: str
-    duration: Optional[int] = None
-    metadata: dict = field(default_factory=dict)
-    kind: ClassVar[ContentType] = "url"
-
-    def render_url(self) -> str:
-        """Return a URL or file:// path that the browser can navigate to."""
-        raise NotImplementedError("Implement in subclasses")
-
-    @staticmethod
-    def new_id() -> str:
-        return str(uuid.uuid4())
-
-    @staticmethod
-    def _generate_html_wrapper(
-        body_html: str,
-        title: str = "InfoBerry",
-        footer: str = "Powered by InfoBerry",
-    ) -> str:
-        """Generate a styled HTML page with optional footer branding."""
-        return f"""<!doctype html>
+# Static page shell shared by generated image/video/error pages, split around
+# the title, body and footer so a render is a plain concatenation.
+_HTML_HEAD = """<!doctype html>
 <html>
 <head>
   <meta charset="utf-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{html.escape(title)}</title>
+  <title>"""
+_HTML_BODY_OPEN = """</title>
   <style>
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-    html, body {{
+    * { margin: 0; padding: 0; box-sizing: border-box; }
+    html, body {
       height: 100%;
       background: #000;
       color: #fff;
       font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
       overflow: hidden;
-    }}
-    .content {{
+    }
+    .content {
       width: 100vw;
       height: calc(100vh - 40px);
       display: flex;
       align-items: center;
       justify-content: center;
-    }}
-    .content img {{
+    }
+    .content img {
       max-width: 100%;
       max-height: 100%;
       object-fit: contain;
-    }}
-    .content video {{
+    }
+    .content video {
       width: 100%;
       height: 100%;
       object-fit: contain;
-    }}
-    .footer {{
+    }
+    .footer {
       position: fixed;
       bottom: 0;
       width: 100%;
@@ -76,122 +63,302 @@ class Content:
       justify-content: center;
       font-size: 14px;
       color: #999;
-    }}
+    }
   </style>
 </head>
 <body>
   <div class="content">
-    {body_html}
+    """
+_HTML_FOOTER_OPEN = """
   </div>
-  <div class="footer">{html.escape(footer)}</div>
+  <div class="footer">"""
+_HTML_TAIL = """</div>
 </body>
 </html>
 """
 
+# Body fragments for the shell above, filled in with % at construction/render
+_IMG_BODY = '<img src="%s" alt="Image">'
+_VIDEO_BODY = """<video src="%s"
+                          autoplay muted loop playsinline
+                          controlslist="nodownload noplaybackrate"
+                          disablepictureinpicture></video>"""
+_ERROR_BODY = '<pre style="color: #f66; padding: 20px;">%s</pre>'
+
+# Rendered URLs keyed by Content.key. Shared across instances so content that
+# survives a config reload keeps its URL and its page is not re-navigated.
+_RENDERED: Dict[ContentKey, str] = {}
+
+# Generated pages go to tmpfs on Linux so renders never touch the SD card; other
+# platforms (e.g. macOS, which has no standard tmpfs) use the default temp dir.
+_SHM_DIR = "/dev/shm"
+_TEMP_DIR = (
+    _SHM_DIR
+    if platform.system() == "Linux"
+    and os.path.isdir(_SHM_DIR)
+    and os.access(_SHM_DIR, os.W_OK)
+    else tempfile.gettempdir()
+)
+
+# Generated pages written during this process, removed again at exit.
+_TEMP_FILES: Set[str] = set()
+
+
+@atexit.register
+def _remove_temp_files() -> None:
+    for name in _TEMP_FILES:
+        try:
+            os.unlink(name)
+        except OSError:
+            pass
+    _TEMP_FILES.clear()
+
+
+# Footer-less video player shared by all videos; reads its source from the URL
+# fragment, including on hashchange when a pooled page is re-pointed.
+_BARE_VIDEO_HTML = """<!doctype html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>InfoBerry</title>
+  <style>
+    html, body { margin: 0; height: 100%; background: #000; overflow: hidden; }
+    video { width: 100%; height: 100%; object-fit: contain; }
+  </style>
+</head>
+<body>
+  <video autoplay muted loop playsinline
+         controlslist="nodownload noplaybackrate"
+         disablepictureinpicture></video>
+  <script>
+    function play() {
+      document.querySelector("video").src = decodeURIComponent(location.hash.slice(1));
+    }
+    window.addEventListener("hashchange", play);
+    play();
+  </script>
+</body>
+</html>
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _bare_video_url() -> str:
+    """Write the shared footer-less video page once and return its URL."""
+    return Content._write_temp_html(_BARE_VIDEO_HTML, prefix="vid_bare_")
+
+
+# Content ids: a random per-process prefix plus a counter, 32 hex digits like a
+# uuid4().hex but without the urandom call and UUID object on every item.
+_ID_PREFIX = os.urandom(8).hex()
+_ID_COUNTER = itertools.count()
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve(source: str) -> Path:
+    """Expand and resolve a local content path once per distinct source."""
+    return Path(source).expanduser().resolve()
+
+
+@dataclass(frozen=True, slots=True)
+class Content:
+    """Base content class with rendering logic."""
+    id: str
+    source: str
+    duration: Optional[int] = None
+    metadata: dict = field(default_factory=dict)
+    footer: bool = True
+    kind: ClassVar[ContentType] = "url"
+
+    @property
+    def key(self) -> ContentKey:
+        """Identity used to match items across reloads and to cache renders."""
+        return (self.kind, self.source, self.footer)
+
+    def render_url(self) -> str:
+        """Return a URL or file:// path that the browser can navigate to.
+
+        The result is cached per key until ContentBank drops the item.
+        """
+        key = self.key
+        url = _RENDERED.get(key)
+        if url is None:
+            try:
+                url = self._render()
+            except FileNotFoundError as e:
+                # Not cached, so the real page is rendered once the file exists
+                return ErrorContent(id=self.id, source=str(e)).render_url()
+            _RENDERED[key] = url
+        return url
+
+    def _render(self) -> str:
+        """Build the URL for this content."""
+        raise NotImplementedError("Implement in subclasses")
+
+    @staticmethod
+    def new_id() -> str:
+        return f"{_ID_PREFIX}{next(_ID_COUNTER):016x}"
+
+    @staticmethod
+    def _generate_html_wrapper(
+        body_html: str,
+        title: str = "InfoBerry",
+        footer: str = "Powered by InfoBerry",
+    ) -> str:
+        """Generate a styled HTML page with optional footer branding."""
+        return "".join(
+            (
+                _HTML_HEAD,
+                html.escape(title),
+                _HTML_BODY_OPEN,
+                body_html,
+                _HTML_FOOTER_OPEN,
+                html.escape(footer),
+                _HTML_TAIL,
+            )
+        )
+
     @staticmethod
     def _write_temp_html(html_content: str, prefix: str = "infoberry_") -> str:
         """Write HTML content to a temporary file and return its file:// URL."""
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            suffix=".html",
-            prefix=prefix,
-            delete=False,  # Keep file so browser can load it
-        ) as f:
-            f.write(html_content)
-            return Path(f.name).as_uri()
-
-
-@dataclass(frozen=True)
+        # Raw fd write: pages are small, so skip the buffered text wrapper.
+        # The file is kept so the browser can load it and removed at exit.
+        fd, name = tempfile.mkstemp(suffix=".html", prefix=prefix, dir=_TEMP_DIR)
+        try:
+            os.write(fd, html_content.encode("utf-8"))
+        finally:
+            os.close(fd)
+        _TEMP_FILES.add(name)
+        return Path(name).as_uri()
+
+
+@dataclass(frozen=True, slots=True)
 class UrlContent(Content):
     """Plain HTTP(S) URL displayed directly."""
     kind: ClassVar[ContentType] = "url"
 
-    def render_url(self) -> str:
+    def _render(self) -> str:
         return self.source
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HtmlFileContent(Content):
     """Local HTML file displayed directly."""
     kind: ClassVar[ContentType] = "html"
 
-    def render_url(self) -> str:
-        path = Path(self.source).expanduser().resolve()
+    def _render(self) -> str:
+        path = _resolve(self.source)
         return path.as_uri()
 
 
-@dataclass(frozen=True)
-class ImageContent(Content):
-    """Local image file wrapped in styled HTML with branding."""
-    kind: ClassVar[ContentType] = "image"
-
-    def render_url(self) -> str:
-        path = Path(self.source).expanduser().resolve()
+@dataclass(frozen=True, slots=True)
+class _MediaContent(Content):
+    """Local media file shown in the branded page, or bare without footer."""
+    _body: str = field(default="", init=False, repr=False, compare=False)
+    _BODY_TEMPLATE: ClassVar[str]
+    _LABEL: ClassVar[str]
+    _FOOTER_NAME: ClassVar[str]
+    _PREFIX: ClassVar[str]
+
+    def __post_init__(self):
+        # source is frozen, so the body fragment can be built once up front.
+        # as_uri() percent-encodes &, <, > and quotes, so it is attribute-safe.
+        # Footer-less items never use the wrapper, so they skip this.
+        if self.footer:
+            uri = _resolve(self.source).as_uri()
+            object.__setattr__(self, "_body", self._BODY_TEMPLATE % uri)
+
+    def _render(self) -> str:
+        path = _resolve(self.source)
         if not path.exists():
-            return ErrorContent(
-                id=self.id, source=f"Image not found: {self.source}"
-            ).render_url()
+            raise FileNotFoundError(f"{self._LABEL} not found: {self.source}")
+        if not self.footer:
+            return self._render_bare(path)
 
-        img_uri = path.as_uri()
-        body = f'<img src="{html.escape(img_uri)}" alt="Image">'
         html_doc = self._generate_html_wrapper(
-            body_html=body,
+            body_html=self._body,
             title=path.name,
-            footer="Powered by InfoBerry · Image Display",
+            footer=f"Powered by InfoBerry · {self._LABEL} {self._FOOTER_NAME}",
         )
-        return self._write_temp_html(html_doc, prefix=f"img_{self.id}_")
+        return self._write_temp_html(html_doc, prefix=f"{self._PREFIX}_{self.id}_")
 
+    def _render_bare(self, path: Path) -> str:
+        """URL for an existing file shown without the branded wrapper."""
+        raise NotImplementedError("Implement in subclasses")
+
+
+@dataclass(frozen=True, slots=True)
+class ImageContent(_MediaContent):
+    """Local image file wrapped in styled HTML with branding."""
+    kind: ClassVar[ContentType] = "image"
+    _BODY_TEMPLATE: ClassVar[str] = _IMG_BODY
+    _LABEL: ClassVar[str] = "Image"
+    _FOOTER_NAME: ClassVar[str] = "Display"
+    _PREFIX: ClassVar[str] = "img"
+
+    def _render_bare(self, path: Path) -> str:
+        # Nothing to wrap: let the browser show the image natively
+        return path.as_uri()
 
-@dataclass(frozen=True)
-class VideoContent(Content):
+
+@dataclass(frozen=True, slots=True)
+class VideoContent(_MediaContent):
     """Local video file wrapped in styled HTML with branding."""
     kind: ClassVar[ContentType] = "video"
+    _BODY_TEMPLATE: ClassVar[str] = _VIDEO_BODY
+    _LABEL: ClassVar[str] = "Video"
+    _FOOTER_NAME: ClassVar[str] = "Player"
+    _PREFIX: ClassVar[str] = "vid"
 
-    def render_url(self) -> str:
-        path = Path(self.source).expanduser().resolve()
-        if not path.exists():
-            return ErrorContent(
-                id=self.id, source=f"Video not found: {self.source}"
-            ).render_url()
-
-        vid_uri = path.as_uri()
-        body = f"""<video src="{html.escape(vid_uri)}"
-                          autoplay muted loop playsinline
-                          controlslist="nodownload noplaybackrate"
-                          disablepictureinpicture></video>"""
-        html_doc = self._generate_html_wrapper(
-            body_html=body,
-            title=path.name,
-            footer="Powered by InfoBerry · Video Player",
-        )
-        return self._write_temp_html(html_doc, prefix=f"vid_{self.id}_")
+    def _render_bare(self, path: Path) -> str:
+        # One shared player page; the video URI travels in the fragment
+        return f"{_bare_video_url()}#{quote(path.as_uri(), safe='')}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorContent(Content):
     """Error message displayed in styled HTML."""
     kind: ClassVar[ContentType] = "error"
 
-    def render_url(self) -> str:
+    def _render(self) -> str:
         msg = html.escape(self.source or "Unknown error")
-        body = f'<pre style="color: #f66; padding: 20px;">{msg}</pre>'
         html_doc = self._generate_html_wrapper(
-            body_html=body, title="Error", footer="InfoBerry Error Display"
+            body_html=_ERROR_BODY % msg, title="Error", footer="InfoBerry Error Display"
         )
         return self._write_temp_html(html_doc, prefix="error_")
 
 
 class ContentBank:
-    """Manages content rotation and state."""
+    """Manages content rotation and state.
+
+    The bank takes ownership of the lists it is given; callers must not mutate
+    them afterwards, and the sequence returned by items() is read-only.
+    """
 
     def __init__(self, items: List[Content]):
-        self._items = items[:]
+        self._items = items
+        self._len = len(items)
+        self._keys = self._index_keys(items)
+        self._urls: Optional[Tuple[str, ...]] = None
         self._index = 0
 
-    def items(self) -> List[Content]:
+    @staticmethod
+    def _index_keys(items: Sequence[Content]) -> Dict[ContentKey, List[int]]:
+        """Map each item key to the indices of all its occurrences, in order."""
+        keys: Dict[ContentKey, List[int]] = {}
+        for i, it in enumerate(items):
+            keys.setdefault(it.key, []).append(i)
+        return keys
+
+    def items(self) -> Sequence[Content]:
         return self._items
 
+    def urls(self) -> Tuple[str, ...]:
+        """Rendered URL of each item, computed once per set of items."""
+        if self._urls is None:
+            self._urls = tuple(it.render_url() for it in self._items)
+        return self._urls
+
     def current(self) -> Tuple[int, Content]:
         if not self._items:
             return 0, ErrorContent(
@@ -200,26 +367,24 @@ class ContentBank:
         return self._index, self._items[self._index]
 
     def next_index(self) -> int:
-        if not self._items:
-            return 0
-        self._index = (self._index + 1) % len(self._items)
+        # Compare against the cached length instead of a modulo per rotation
+        i = self._index + 1
+        self._index = i if i < self._len else 0
         return self._index
 
     def set_items(self, items: List[Content]) -> None:
-        old = self._items
-        self._items = items[:]
-        if not self._items:
+        old, old_keys = self._items, self._keys
+        self._items = items
+        self._len = len(items)
+        self._keys = self._index_keys(items)
+        self._urls = None
+        for key in old_keys.keys() - self._keys.keys():
+            _RENDERED.pop(key, None)
+        if not self._items or self._index >= len(old):
             self._index = 0
             return
-        try:
-            cur = old[self._index]
-            self._index = next(
-                i
-                for i, it in enumerate(self._items)
-                if (it.kind, it.source) == (cur.kind, cur.source)
-            )
-        except Exception:
-            self._index = 0
+        cur = old[self._index]
+        self._index = self._keys.get(cur.key, [0])[0]
 
     def duration_for(self, content: Content, default_seconds: int) -> int:
         return (
@@ -229,13 +394,25 @@ class ContentBank:
         )
 
     def diff(self, new_items: List[Content]) -> dict:
-        old_keys = {(it.kind, it.source): i for i, it in enumerate(self._items)}
-        new_keys = {(it.kind, it.source): i for i, it in enumerate(new_items)}
-        removed = [old_keys[k] for k in old_keys.keys() - new_keys.keys()]
-        added = [new_keys[k] for k in new_keys.keys() - old_keys.keys()]
-        modified = [
-            (old_keys[k], new_keys[k])
-            for k in old_keys.keys() & new_keys.keys()
-            if self._items[old_keys[k]].duration != new_items[new_keys[k]].duration
-        ]
+        # Reloading an unchanged config is the common case: ids are fresh on
+        # every load, so compare what matters in lockstep before building dicts
+        if len(new_items) == len(self._items) and all(
+            a.key == b.key and a.duration == b.duration
+            for a, b in zip(self._items, new_items)
+        ):
+            return {"removed": [], "added": [], "modified": []}
+        # One pass over new_items; whatever is left in `old` afterwards was removed.
+        # Repeated items pair up with old occurrences of the same key in order
+        old = {key: deque(idx) for key, idx in self._keys.items()}
+        added: List[int] = []
+        modified: List[Tuple[int, int]] = []
+        for j, it in enumerate(new_items):
+            left = old.get(it.key)
+            if not left:
+                added.append(j)
+                continue
+            i = left.popleft()
+            if self._items[i].duration != it.duration:
+                modified.append((i, j))
+        removed = sorted(i for left in old.values() for i in left)
         return {"removed": removed, "added": added, "modified": modified}
@@ -5,12 +5,15 @@ import logging
 import os
 import platform
 import subprocess
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Set
 
-from playwright.async_api import Browser, async_playwright
+from playwright.async_api import Browser, Page, async_playwright
 
 logger = logging.getLogger(__name__)
 
+# The OS does not change while we run; avoid a uname() per launch/rotation
+_SYSTEM = platform.system()
+
 
 class Display:
     """Playwright-backed view: manages browser lifecycle and pages."""
@@ -24,88 +27,163 @@ class Display:
         self.rotation = rotation
         self._playwright = None
         self._browser: Optional[Browser] = None
+        self._browser_screen: Optional[str] = None  # screen the browser runs on
         self._context = None
-        self._pages = []
-        self._urls: List[str] = []
+        # One page per distinct URL, reused across reloads and reorderings
+        self._pages: Dict[str, Page] = {}
+        self._order: List[str] = []  # URL shown for each content index
+        self._failed: Set[str] = set()  # URLs whose last navigation failed
+        # X settings already applied per screen, so relaunches skip the forks
+        self._unblanked: Set[str] = set()
+        self._rotations: Dict[str, Optional[str]] = {}
         self._lock = asyncio.Lock()
 
-    async def launch(self):
-        is_linux = platform.system() == "Linux"
-        is_macos = platform.system() == "Darwin"
+    def apply_rotation(self, rotation: Optional[str]):
+        """Rotate the screen in place; the browser keeps running."""
+        self.rotation = rotation
+        if _SYSTEM != "Linux":
+            return
+        if self.screen in self._rotations and self._rotations[self.screen] == rotation:
+            return
+        subprocess.run(
+            ["xrandr", "--output", "HDMI-1", "--rotate", rotation or "normal"],
+            check=False,
+        )
+        self._rotations[self.screen] = rotation
+
+    async def launch(self, urls: Optional[Sequence[str]] = None):
+        """Open a fresh browser context, starting Playwright/Chromium if needed.
+
+        If `urls` is given, their pages are opened and loaded concurrently as
+        part of the launch, so the first rotation does not wait on them.
+        """
+        is_linux = _SYSTEM == "Linux"
+        is_macos = _SYSTEM == "Darwin"
 
         if is_linux:
             os.environ["DISPLAY"] = self.screen
-            subprocess.run(["xset", "-dpms"], check=False)
-            subprocess.run(["xset", "s", "off"], check=False)
-            subprocess.run(["xset", "s", "noblank"], check=False)
-            if self.rotation:
+            if self.screen not in self._unblanked:
+                # One xset process for all screen-blanking/power settings
                 subprocess.run(
-                    ["xrandr", "--output", "HDMI-1", "--rotate", self.rotation],
-                    check=False,
+                    ["xset", "-dpms", "s", "off", "s", "noblank"], check=False
                 )
+                self._unblanked.add(self.screen)
+            # Also covers a rotation that was removed while the display was
+            # closed; an unrotated screen without history needs no xrandr
+            if self._rotations.get(self.screen) != self.rotation:
+                self.apply_rotation(self.rotation)
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        # The browser outlives close(); a new one is only needed when it died
+        # or was started on a different X screen
+        if self._browser is not None and (
+            not self._browser.is_connected() or self._browser_screen != self.screen
+        ):
+            await self._close_browser()
+
+        if self._browser is None:
+            launch_args = []
+            if is_linux:
+                launch_args += ["--kiosk"]
+            elif is_macos:
+                launch_args += [
+                    "--start-maximized",
+                    "--disable-session-crashed-bubble",
+                    "--disable-features=TranslateUI",
+                ]
+
+            self._browser = await self._playwright.chromium.launch(
+                headless=False,
+                args=launch_args
+                + [
+                    "--disable-infobars",
+                    "--noerrdialogs",
+                    "--autoplay-policy=no-user-gesture-required",
+                ],
+            )
+            self._browser_screen = self.screen
 
-        self._playwright = await async_playwright().start()
-
-        launch_args = []
-        if is_linux:
-            launch_args += ["--kiosk"]
-        elif is_macos:
-            launch_args += [
-                "--start-maximized",
-                "--disable-session-crashed-bubble",
-                "--disable-features=TranslateUI",
-            ]
-
-        self._browser = await self._playwright.chromium.launch(
-            headless=False,
-            args=launch_args
-            + [
-                "--disable-infobars",
-                "--noerrdialogs",
-                "--autoplay-policy=no-user-gesture-required",
-            ],
-        )
         self._context = await self._browser.new_context(
             viewport=None,
             no_viewport=True,
         )
+        if urls is not None:
+            await self.ensure_pages(urls)
 
-    async def ensure_pages(self, urls: List[str]):
+    async def ensure_pages(self, urls: Sequence[str]):
         async with self._lock:
             if self._context is None:
                 raise RuntimeError("Display not launched")
-            while len(self._pages) < len(urls):
-                p = await self._context.new_page()
-                await p.goto("about:blank")
-                self._pages.append(p)
-            while len(self._pages) > len(urls):
-                p = self._pages.pop()
-                try:
-                    await p.close()
-                except Exception:
-                    logger.exception("closing extra page failed")
-            for i, url in enumerate(urls):
-                if i >= len(self._urls) or self._urls[i] != url:
-                    await self._pages[i].goto(
-                        url, wait_until="domcontentloaded", timeout=30000
+            wanted = dict.fromkeys(urls)
+            # Pages whose URL left the playlist are recycled for new URLs
+            stale = [u for u in self._pages if u not in wanted]
+            new_urls = [u for u in wanted if u not in self._pages]
+            missing = len(new_urls) - len(stale)
+            fresh = []
+            if missing > 0:
+                # New pages already start out on about:blank
+                results = await asyncio.gather(
+                    *(self._context.new_page() for _ in range(missing)),
+                    return_exceptions=True,
+                )
+                fresh = [r for r in results if not isinstance(r, BaseException)]
+                errors = [r for r in results if isinstance(r, BaseException)]
+                if errors:
+                    # Leave the pool as it was; don't orphan the pages we did get
+                    await asyncio.gather(
+                        *(p.close() for p in fresh), return_exceptions=True
                     )
-            self._urls = urls[:]
+                    raise errors[0]
+            spare = [self._pages.pop(u) for u in stale] + fresh
+            self._pages.update(zip(new_urls, spare))
+            extras = spare[len(new_urls) :]
+            results = await asyncio.gather(
+                *(p.close() for p in extras), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("closing extra page failed", exc_info=result)
+            # Navigate every changed page at once; load time is the slowest
+            # page instead of the sum of all of them
+            retry = [u for u in self._failed if u in self._pages and u not in new_urls]
+            pending = new_urls + retry
+            results = await asyncio.gather(
+                *(
+                    self._pages[u].goto(u, wait_until="domcontentloaded", timeout=30000)
+                    for u in pending
+                ),
+                return_exceptions=True,
+            )
+            self._failed = set()
+            for url, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    logger.error("loading %s failed", url, exc_info=result)
+                    self._failed.add(url)  # retried on the next ensure_pages()
+            self._order = list(urls)
+
+    def _page_at(self, index: int) -> Optional[Page]:
+        if not self._order:
+            return None
+        index = max(0, min(index, len(self._order) - 1))
+        return self._pages.get(self._order[index])
 
     async def show(self, index: int):
         async with self._lock:
-            if not self._pages:
-                return
-            index = max(0, min(index, len(self._pages) - 1))
-            await self._pages[index].bring_to_front()
+            page = self._page_at(index)
+            if page is not None:
+                await page.bring_to_front()
 
     async def reload(self, index: int):
         async with self._lock:
-            if 0 <= index < len(self._pages):
-                await self._pages[index].reload(
+            if 0 <= index < len(self._order):
+                await self._pages[self._order[index]].reload(
                     wait_until="domcontentloaded", timeout=30000
                 )
 
     async def close(self):
+        """Close the browser context and its pages; the browser keeps running."""
         async with self._lock:
             try:
                 if self._context is not None:
@@ -116,15 +194,14 @@ class Display:
                 self._context = None
 
             self._pages.clear()
-            self._urls.clear()
+            self._order.clear()
+            self._failed.clear()
 
-            try:
-                if self._browser is not None:
-                    await self._browser.close()
-            except Exception:
-                logger.debug("browser already closed", exc_info=True)
-            finally:
-                self._browser = None
+    async def shutdown(self):
+        """Close everything, including the browser and the Playwright driver."""
+        await self.close()
+        async with self._lock:
+            await self._close_browser()
 
             try:
                 if self._playwright is not None:
@@ -133,3 +210,13 @@ class Display:
                 logger.debug("playwright already stopped", exc_info=True)
             finally:
                 self._playwright = None
+
+    async def _close_browser(self):
+        try:
+            if self._browser is not None:
+                await self._browser.close()
+        except Exception:
+            logger.debug("browser already closed", exc_info=True)
+        finally:
+            self._browser = None
+            self._browser_screen = None
@@ -2,14 +2,32 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import sys
 from pathlib import Path
 
 from info_berry.client.config import AppConfig, load_config
 from info_berry.client.content import ContentBank
 from info_berry.client.display import Display
 
+try:
+    from watchfiles import awatch
+except ImportError:  # optional: fall back to polling the config mtime
+    awatch = None
+
 logger = logging.getLogger(__name__)
 
+# Quiet period a changed config file must stay untouched before it is reloaded
+_RELOAD_SETTLE_SECONDS = 0.3
+
+# What the poller compares between ticks: (st_mtime_ns, st_size, st_ino).
+# The inode catches editors that save by renaming a new file into place.
+_FileStamp = tuple[int, int, int]
+
+# asyncio.timeout() (3.11+) waits in the current task; wait_for() on 3.10
+# wraps the wait in a task of its own, so it is only the fallback.
+_HAS_ASYNCIO_TIMEOUT = sys.version_info >= (3, 11)
+
 
 class Player:
     def __init__(self, config_file: str):
@@ -25,12 +43,13 @@ class Player:
         self._tasks: dict[str, asyncio.Task] = {}
         self._shutdown: asyncio.Event = asyncio.Event()
         self._lock: asyncio.Lock = asyncio.Lock()
-        path = Path(config_file)
-        self._last_mtime: float | None = path.stat().st_mtime if path.exists() else None
+        self._last_stamp: _FileStamp | None = self._stamp(config_file)
+        # URLs last handed to the display, one per content index
+        self._shown_urls: tuple[str, ...] = ()
 
     async def run(self):
-        await self._display.launch()
-        await self._display.ensure_pages([c.render_url() for c in self._bank.items()])
+        self._shown_urls = self._bank.urls()
+        await self._display.launch(self._shown_urls)
         self._tasks["rotate"] = asyncio.create_task(self._rotate_loop(), name="rotate")
         self._tasks["cfgwatch"] = asyncio.create_task(
             self._config_watch_loop(), name="cfgwatch"
@@ -50,7 +69,18 @@ class Player:
             t.cancel()
         await asyncio.gather(*self._tasks.values(), return_exceptions=True)
         self._tasks.clear()
-        await self._display.close()
+        await self._display.shutdown()
+
+    async def _sleep(self, seconds: float):
+        """Wait for up to `seconds`, returning early once shutdown is requested."""
+        try:
+            if _HAS_ASYNCIO_TIMEOUT:
+                async with asyncio.timeout(seconds):
+                    await self._shutdown.wait()
+            else:
+                await asyncio.wait_for(self._shutdown.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
 
     async def _rotate_loop(self):
         while not self._shutdown.is_set():
@@ -72,53 +102,113 @@ class Player:
                     cur.source,
                     dur,
                 )
-                try:
-                    await asyncio.wait_for(self._shutdown.wait(), timeout=dur)
-                except asyncio.TimeoutError:
-                    pass
+                await self._sleep(dur)
                 self._bank.next_index()
             except Exception as e:
                 # Never let the task die silently; log and continue
                 logger.exception("rotation tick failed: %s", e)
-                await asyncio.sleep(1)
+                await self._sleep(1)
 
     async def _refresh_loop(self):
         interval = int(self._cfg.behavior.refresh_interval)
         while not self._shutdown.is_set():
-            try:
-                await asyncio.wait_for(self._shutdown.wait(), timeout=interval)
-            except asyncio.TimeoutError:
-                pass
+            await self._sleep(interval)
+            if self._shutdown.is_set():
+                break
             idx, _ = self._bank.current()
             await self._display.reload(idx)
 
     async def _config_watch_loop(self):
-        path = Path(self.config_file)
+        if awatch is None:
+            await self._poll_config_loop()
+            return
+        path = Path(self.config_file).resolve()
+        try:
+            # Watch the directory, not its subtree: editors often save by
+            # replacing the file, and only events for the file itself wake us
+            async for _ in awatch(
+                path.parent,
+                stop_event=self._shutdown,
+                recursive=False,
+                watch_filter=lambda _, p: Path(p) == path,
+            ):
+                try:
+                    await self._reload_config()
+                except Exception as e:
+                    logger.exception("config reload error: %s", e)
+        except Exception as e:
+            logger.exception("config watcher failed, polling instead: %s", e)
+            await self._poll_config_loop()
+
+    async def _poll_config_loop(self):
+        path = self.config_file
         while not self._shutdown.is_set():
             try:
-                await asyncio.sleep(1)
-                if not path.exists():
+                await self._sleep(1)
+                stamp = self._stamp(path)
+                if (
+                    stamp is None
+                    or self._last_stamp is None
+                    or stamp == self._last_stamp
+                ):
                     continue
-                mtime = path.stat().st_mtime
-                if self._last_mtime is None or mtime <= self._last_mtime:
-                    continue
-                self._last_mtime = mtime
+                self._last_stamp = stamp
+                await self._settle(path)
                 await self._reload_config()
             except Exception as e:
                 logger.exception("config watch error: %s", e)
 
+    def _stamp(self, path: str) -> _FileStamp | None:
+        """One stat() of `path` as a comparable stamp, or None if it is missing."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    async def _settle(self, path: str):
+        """Wait until `path` stops changing so a burst of saves reloads once."""
+        last = self._last_stamp
+        while not self._shutdown.is_set():
+            await self._sleep(_RELOAD_SETTLE_SECONDS)
+            # A missing file is an editor mid-save; keep waiting
+            stamp = self._stamp(path)
+            if stamp is not None and stamp == last:
+                break
+            last = stamp
+        self._last_stamp = last
+
     async def _reload_config(self):
         async with self._lock:
             new_cfg = load_config(self.config_file)
-            disp_changed = new_cfg.display != self._cfg.display
+            old_disp, new_disp = self._cfg.display, new_cfg.display
+            # Rotation is applied in place; screen/size changes reopen the display
+            relaunch = (new_disp.screen, new_disp.width, new_disp.height) != (
+                old_disp.screen,
+                old_disp.width,
+                old_disp.height,
+            )
             self._cfg = new_cfg
             diff = self._bank.diff(new_cfg.contents)
             self._bank.set_items(new_cfg.contents)
-            urls = [c.render_url() for c in self._bank.items()]
-            if disp_changed:
+            if relaunch:
                 await self._display.close()
-                await self._display.launch()
-            await self._display.ensure_pages(urls)
+                self._display.screen = new_disp.screen
+                self._display.width = new_disp.width
+                self._display.height = new_disp.height
+                self._display.rotation = new_disp.rotation
+                self._shown_urls = self._bank.urls()
+                await self._display.launch(self._shown_urls)
+            else:
+                if new_disp.rotation != old_disp.rotation:
+                    self._display.apply_rotation(new_disp.rotation)
+                # Durations only affect the rotate loop; pages need updating
+                # when items were added, removed or reordered, or when an
+                # item's URL changed (e.g. its missing media file appeared)
+                urls = self._bank.urls()
+                if urls != self._shown_urls:
+                    self._shown_urls = urls
+                    await self._display.ensure_pages(urls)
             logger.info(
                 "config reloaded added=%s removed=%s modified=%s",
                 diff["added"],
@@ -0,0 +1,131 @@
+"""Hand-rolled Playwright stand-ins for the display tests.
+
+Each stub implements only what Display uses and records calls in plain
+attributes, which is much cheaper than a MagicMock graph.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Optional
+
+
+class FakePage:
+    """Page recording navigations; `goto_errors` are raised in call order."""
+
+    def __init__(self, goto_errors: Iterable[Optional[Exception]] = ()):
+        self.gotos: List[tuple] = []
+        self.reloads: List[dict] = []
+        self.fronts = 0
+        self.closes = 0
+        self._goto_errors = list(goto_errors)
+
+    async def goto(self, url: str, **kwargs):
+        self.gotos.append((url, kwargs))
+        if self._goto_errors:
+            error = self._goto_errors.pop(0)
+            if error is not None:
+                raise error
+
+    async def bring_to_front(self):
+        self.fronts += 1
+
+    async def reload(self, **kwargs):
+        self.reloads.append(kwargs)
+
+    async def close(self):
+        self.closes += 1
+
+
+class FakeContext:
+    """Context handing out queued pages first, then fresh FakePages."""
+
+    def __init__(self, queued: List[FakePage]):
+        self.pages: List[FakePage] = []
+        self.closes = 0
+        self._queued = queued
+
+    async def new_page(self) -> FakePage:
+        page = self._queued.pop(0) if self._queued else FakePage()
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closes += 1
+
+
+class FakeBrowser:
+    def __init__(self, queued: List[FakePage]):
+        self.contexts: List[FakeContext] = []
+        self.closes = 0
+        self.connected = True
+        self._queued = queued
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_context(self, **kwargs) -> FakeContext:
+        context = FakeContext(self._queued)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closes += 1
+
+
+class FakeChromium:
+    def __init__(self, queued: List[FakePage]):
+        self.launches: List[dict] = []
+        self.browsers: List[FakeBrowser] = []
+        self._queued = queued
+
+    async def launch(self, **kwargs) -> FakeBrowser:
+        self.launches.append(kwargs)
+        browser = FakeBrowser(self._queued)
+        self.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self, queued: List[FakePage]):
+        self.chromium = FakeChromium(queued)
+        self.stops = 0
+
+    async def stop(self):
+        self.stops += 1
+
+
+class FakeAsyncPlaywright:
+    """Stands in for the object returned by async_playwright().
+
+    Pages added to `queued` are handed out by the next new_page() calls,
+    so tests can prepare pages with specific behaviour up front.
+    """
+
+    def __init__(self):
+        self.queued: List[FakePage] = []
+        self.playwright = FakePlaywright(self.queued)
+        self.starts = 0
+
+    async def start(self) -> FakePlaywright:
+        self.starts += 1
+        return self.playwright
+
+    @property
+    def browser(self) -> FakeBrowser:
+        """The most recently launched browser."""
+        return self.playwright.chromium.browsers[-1]
+
+    @property
+    def context(self) -> FakeContext:
+        """The most recently created context."""
+        return self.browser.contexts[-1]
+
+    @property
+    def pages(self) -> List[FakePage]:
+        """Every page opened, in creation order."""
+        return [
+            page
+            for browser in self.playwright.chromium.browsers
+            for context in browser.contexts
+            for page in context.pages
+        ]
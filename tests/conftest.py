@@ -2,81 +2,98 @@
 
 from __future__ import annotations
 
-import asyncio
-import tempfile
+import copy
+import shutil
 from pathlib import Path
+from types import SimpleNamespace
 from typing import AsyncGenerator, Generator
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import patch
 
 import pytest
 import yaml
 
+from info_berry.client.config import parse_config
+from info_berry.client.display import Display
+from tests._stubs import FakeAsyncPlaywright
+
+_SAMPLE_CONFIG = {
+    "display": {
+        "screen": ":0",
+        "width": 1920,
+        "height": 1080,
+        "rotation": None,
+    },
+    "behavior": {
+        "rotation_interval": 30,
+        "refresh_interval": 300,
+    },
+    "content": [
+        {"type": "url", "source": "https://example.com", "duration": 10},
+        {"type": "html", "source": "/path/to/file.html", "duration": 20},
+        {"type": "image", "source": "/path/to/image.png", "duration": 15},
+    ],
+}
+
 
 @pytest.fixture
 def sample_config_dict() -> dict:
     """Sample configuration dictionary."""
-    return {
-        "display": {
-            "screen": ":0",
-            "width": 1920,
-            "height": 1080,
-            "rotation": None,
-        },
-        "behavior": {
-            "rotation_interval": 30,
-            "refresh_interval": 300,
-        },
-        "content": [
-            {"type": "url", "source": "https://example.com", "duration": 10},
-            {"type": "html", "source": "/path/to/file.html", "duration": 20},
-            {"type": "image", "source": "/path/to/image.png", "duration": 15},
-        ],
-    }
+    return copy.deepcopy(_SAMPLE_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def baseline_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """The sample config written once per session; tests must not modify it."""
+    config_file = tmp_path_factory.mktemp("cfg") / "test-config.yaml"
+    config_file.write_text(yaml.dump(_SAMPLE_CONFIG))
+    return config_file
 
 
 @pytest.fixture
 def temp_config_file(
-    sample_config_dict: dict, tmp_path: Path
+    baseline_config_file: Path, tmp_path: Path
 ) -> Generator[Path, None, None]:
-    """Create a temporary config file."""
+    """Create a temporary config file that the test may modify."""
     config_file = tmp_path / "test-config.yaml"
-    config_file.write_text(yaml.dump(sample_config_dict))
+    shutil.copy(baseline_config_file, config_file)
     yield config_file
 
 
 @pytest.fixture
-def mock_playwright():
-    """Mock playwright context."""
-    mock = MagicMock()
-    mock.chromium.launch = AsyncMock()
-    mock.stop = AsyncMock()
-    return mock
+def memory_config(sample_config_dict: dict) -> Generator[dict, None, None]:
+    """Serve `sample_config_dict` to Player without a config file on disk.
 
-
-@pytest.fixture
-def mock_browser():
-    """Mock browser instance."""
-    browser = MagicMock()
-    browser.new_context = AsyncMock()
-    browser.close = AsyncMock()
-    return browser
+    The dict is parsed on every load, so tests can edit it before a reload.
+    """
+    with patch(
+        "info_berry.client.player.load_config",
+        side_effect=lambda _: parse_config(sample_config_dict),
+    ):
+        yield sample_config_dict
 
 
 @pytest.fixture
-def mock_context():
-    """Mock browser context."""
-    context = MagicMock()
-    context.new_page = AsyncMock()
-    context.close = AsyncMock()
-    return context
+def display_mocks() -> Generator[SimpleNamespace, None, None]:
+    """Patch Playwright, platform and X tools for the display module.
+
+    `pw` is the FakeAsyncPlaywright handed to Display. The platform defaults
+    to Darwin; patch `info_berry.client.display._SYSTEM` to test Linux.
+    """
+    pw = FakeAsyncPlaywright()
+    with (
+        patch("info_berry.client.display.async_playwright", return_value=pw),
+        patch("info_berry.client.display._SYSTEM", "Darwin"),
+        patch("info_berry.client.display.subprocess.run") as mock_run,
+        patch.dict("info_berry.client.display.os.environ"),
+    ):
+        yield SimpleNamespace(pw=pw, run=mock_run)
 
 
 @pytest.fixture
-def mock_page():
-    """Mock page instance."""
-    page = MagicMock()
-    page.goto = AsyncMock()
-    page.bring_to_front = AsyncMock()
-    page.reload = AsyncMock()
-    page.close = AsyncMock()
-    return page
+async def launched_display(
+    display_mocks: SimpleNamespace,
+) -> AsyncGenerator[tuple[Display, SimpleNamespace], None]:
+    """A default Display launched against the mocks from `display_mocks`."""
+    display = Display()
+    await display.launch()
+    yield display, display_mocks
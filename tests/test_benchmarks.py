@@ -0,0 +1,32 @@
+"""Benchmarks for ContentBank hot paths.
+
+Skipped when pytest-benchmark is not installed; run only these with
+`pytest --benchmark-only`, or leave them out with `--benchmark-skip`.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from info_berry.client.content import ContentBank
+from tests.test_content import _url_items
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_diff_benchmark(benchmark):
+    """Benchmark diff on a large, shifted playlist."""
+    bank = ContentBank(_url_items(0))
+    benchmark(bank.diff, _url_items(1))
+
+
+def test_set_items_benchmark(benchmark):
+    """Benchmark set_items on a large, shifted playlist."""
+    bank = ContentBank(_url_items(0))
+    benchmark(bank.set_items, _url_items(1))
+
+
+def test_next_index_benchmark(benchmark):
+    """Benchmark advancing the rotation of a large playlist."""
+    bank = ContentBank(_url_items(0))
+    benchmark(bank.next_index)
@@ -14,6 +14,7 @@ from info_berry.client.config import (
     DisplayConfig,
     _to_content,
     load_config,
+    parse_config,
 )
 from info_berry.client.content import (
     HtmlFileContent,
@@ -112,13 +113,21 @@ class TestToContent:
         content = _to_content(obj)
         assert content.duration is None
 
+    def test_footer_defaults_to_enabled(self):
+        """Test content shows the footer unless the config turns it off."""
+        obj = {"type": "image", "source": "/path/to/image.png"}
+        assert _to_content(obj).footer is True
+
+        obj["footer"] = False
+        assert _to_content(obj).footer is False
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
 
-    def test_load_valid_config(self, temp_config_file: Path):
+    def test_load_valid_config(self, baseline_config_file: Path):
         """Test loading valid configuration file."""
-        config = load_config(str(temp_config_file))
+        config = load_config(str(baseline_config_file))
         assert isinstance(config, AppConfig)
         assert config.display.width == 1920
         assert config.display.height == 1080
@@ -168,3 +177,26 @@ class TestLoadConfig:
 
         config = load_config(str(config_file))
         assert config.display.rotation == "left"
+
+
+class TestParseConfig:
+    """Tests for parse_config function."""
+
+    def test_parse_config_from_dict(self, sample_config_dict: dict):
+        """Test parsing an already-loaded configuration mapping."""
+        config = parse_config(sample_config_dict)
+        assert isinstance(config, AppConfig)
+        assert config.display.screen == ":0"
+        assert config.behavior.refresh_interval == 300
+        assert [c.source for c in config.contents] == [
+            "https://example.com",
+            "/path/to/file.html",
+            "/path/to/image.png",
+        ]
+
+    def test_parse_empty_config(self):
+        """Test an empty mapping falls back to the defaults."""
+        config = parse_config({})
+        assert config.display.width == 1920
+        assert config.behavior.rotation_interval == 30
+        assert config.contents == []
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import html
 from pathlib import Path
+from urllib.parse import unquote
 
 import pytest
 
+from info_berry.client import content as content_module
 from info_berry.client.content import (
     Content,
     ContentBank,
@@ -22,99 +24,154 @@ class TestContent:
     """Tests for Content base class."""
 
     def test_new_id_generates_uuid(self):
-        """Test that new_id generates valid UUID."""
+        """Test that new_id generates unique hex ids."""
         id1 = Content.new_id()
         id2 = Content.new_id()
         assert id1 != id2
-        assert len(id1) == 36  # UUID format
+        assert len(id1) == 32  # same width as uuid4().hex
+        int(id1, 16)
 
-
-class TestUrlContent:
-    """Tests for UrlContent."""
-
-    def test_to_url_returns_source(self):
-        """Test that to_url returns the source URL."""
-        content = UrlContent(
-            id=Content.new_id(), source="https://example.com", duration=10
-        )
-        assert content.to_url() == "https://example.com"
-        assert content.kind == "url"
-
-    def test_url_content_with_no_duration(self):
-        """Test UrlContent without duration."""
+    def test_content_with_no_duration(self):
+        """Test content without duration."""
         content = UrlContent(id=Content.new_id(), source="https://example.com")
         assert content.duration is None
 
-
-class TestHtmlFileContent:
-    """Tests for HtmlFileContent."""
-
-    def test_to_url_returns_file_protocol(self):
-        """Test that to_url returns file:// URL."""
-        content = HtmlFileContent(
-            id=Content.new_id(), source="/tmp/test.html", duration=10
-        )
-        url = content.to_url()
-        assert url.startswith("file://")
-        assert content.kind == "html"
+    @pytest.mark.parametrize(
+        "cls", [UrlContent, HtmlFileContent, ImageContent, VideoContent, ErrorContent]
+    )
+    def test_content_has_no_instance_dict(self, cls):
+        """Test content classes use slots instead of a per-instance __dict__."""
+        content = cls(id=Content.new_id(), source="/tmp/x")
+        assert not hasattr(content, "__dict__")
+
+    def test_render_url_is_cached(self):
+        """Test that render_url renders once and reuses the result."""
+        content = ErrorContent(id=Content.new_id(), source="Something went wrong")
+        # Each render writes a new temp file, so equal URLs mean one render
+        assert content.render_url() == content.render_url()
+
+    def test_render_url_is_shared_across_instances(self):
+        """Test that equal (kind, source) content reuses the rendered URL."""
+        first = ErrorContent(id=Content.new_id(), source="Shared error")
+        second = ErrorContent(id=Content.new_id(), source="Shared error")
+        assert first.render_url() == second.render_url()
+
+    def test_temp_files_are_removed_at_exit(self, monkeypatch):
+        """Test that generated pages are tracked and removed by the exit hook."""
+        monkeypatch.setattr(content_module, "_TEMP_FILES", set())
+        url = Content._write_temp_html("<p>hello</p>")
+        path = Path(url.removeprefix("file://"))
+        assert path.read_text() == "<p>hello</p>"
+
+        content_module._remove_temp_files()
+        assert not path.exists()
+
+    def test_temp_files_are_written_to_temp_dir(self, monkeypatch, tmp_path: Path):
+        """Test that generated pages are written to the configured temp dir."""
+        monkeypatch.setattr(content_module, "_TEMP_DIR", str(tmp_path))
+        url = Content._write_temp_html("<p>hello</p>")
+        assert Path(url.removeprefix("file://")).parent == tmp_path
+
+
+@pytest.mark.parametrize(
+    "cls,source,kind,url_prefix",
+    [
+        (UrlContent, "https://example.com", "url", "https://example.com"),
+        (HtmlFileContent, "/tmp/test.html", "html", "file:///tmp/test.html"),
+        (ImageContent, "image.png", "image", "file://"),
+        (VideoContent, "video.mp4", "video", "file://"),
+        (ErrorContent, "Something went wrong", "error", "file://"),
+    ],
+)
+def test_render_url(cls, source, kind, url_prefix, tmp_path: Path):
+    """Test that each content kind renders to a URL the browser can open."""
+    if cls in (ImageContent, VideoContent):
+        media = tmp_path / source
+        media.write_bytes(b"")
+        source = str(media)
+    content = cls(id=Content.new_id(), source=source, duration=10)
+    assert content.kind == kind
+    assert content.render_url().startswith(url_prefix)
 
 
 class TestImageContent:
     """Tests for ImageContent."""
 
-    def test_to_url_returns_data_uri(self):
-        """Test that to_url returns data URI with HTML."""
-        content = ImageContent(
-            id=Content.new_id(), source="/tmp/image.png", duration=10
-        )
-        url = content.to_url()
-        assert url.startswith("data:text/html;charset=utf-8,")
-        assert content.kind == "image"
-
-    def test_image_html_contains_img_tag(self):
-        """Test that generated HTML contains img tag."""
-        content = ImageContent(
-            id=Content.new_id(), source="/tmp/image.png", duration=10
-        )
-        url = content.to_url()
-        # The HTML is double-escaped: html.escape(html_doc) where html_doc contains <img>
-        # So we check for the escaped version
-        assert "&lt;img" in url
+    def test_image_html_contains_img_tag(self, tmp_path: Path):
+        """Test that the generated page shows the image."""
+        image = tmp_path / "image.png"
+        image.write_bytes(b"")
+        content = ImageContent(id=Content.new_id(), source=str(image), duration=10)
+        doc = Path(content.render_url().removeprefix("file://")).read_text()
+        assert f'<img src="{image.as_uri()}"' in doc
+
+    def test_special_characters_in_path_are_encoded(self, tmp_path: Path):
+        """Test that HTML-special characters in the path end up percent-encoded."""
+        image = tmp_path / 'a&b"<c>.png'
+        image.write_bytes(b"")
+        content = ImageContent(id=Content.new_id(), source=str(image))
+        doc = Path(content.render_url().removeprefix("file://")).read_text()
+        assert "a%26b%22%3Cc%3E.png" in doc
+        assert 'a&b"' not in doc
+
+    def test_missing_image_is_not_cached(self, tmp_path: Path):
+        """Test that a missing image renders its page once the file appears."""
+        image = tmp_path / "late.png"
+        content = ImageContent(id=Content.new_id(), source=str(image))
+        missing_url = content.render_url()
+        doc = Path(missing_url.removeprefix("file://")).read_text()
+        assert "Image not found" in doc
+
+        image.write_bytes(b"")
+        assert content.render_url() != missing_url
+
+    def test_image_without_footer_is_shown_directly(self, tmp_path: Path):
+        """Test that an image without footer renders to its own file URL."""
+        image = tmp_path / "plain.png"
+        image.write_bytes(b"")
+        content = ImageContent(id=Content.new_id(), source=str(image), footer=False)
+        assert content.render_url() == image.as_uri()
+
+    def test_image_without_footer_skips_body(self, tmp_path: Path):
+        """Test that the wrapper body is only built for footered images."""
+        image = tmp_path / "plain.png"
+        plain = ImageContent(id=Content.new_id(), source=str(image), footer=False)
+        branded = ImageContent(id=Content.new_id(), source=str(image))
+        assert plain._body == ""
+        assert image.as_uri() in branded._body
 
 
 class TestVideoContent:
     """Tests for VideoContent."""
 
-    def test_to_url_returns_data_uri(self):
-        """Test that to_url returns data URI with HTML."""
-        content = VideoContent(
-            id=Content.new_id(), source="/tmp/video.mp4", duration=30
-        )
-        url = content.to_url()
-        assert url.startswith("data:text/html;charset=utf-8,")
-        assert content.kind == "video"
-
-    def test_video_html_contains_video_tag(self):
-        """Test that generated HTML contains video tag."""
-        content = VideoContent(
-            id=Content.new_id(), source="/tmp/video.mp4", duration=30
-        )
-        url = content.to_url()
-        # The HTML is double-escaped
-        assert "&lt;video" in url
-
-
-class TestErrorContent:
-    """Tests for ErrorContent."""
-
-    def test_to_url_returns_error_message(self):
-        """Test that to_url returns error HTML."""
-        content = ErrorContent(
-            id=Content.new_id(), source="Something went wrong", duration=5
+    def test_video_html_contains_video_tag(self, tmp_path: Path):
+        """Test that the generated page plays the video."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"")
+        content = VideoContent(id=Content.new_id(), source=str(video), duration=30)
+        doc = Path(content.render_url().removeprefix("file://")).read_text()
+        assert f'<video src="{video.as_uri()}"' in doc
+
+    def test_videos_without_footer_share_one_page(self, tmp_path: Path):
+        """Test that footer-less videos reuse one player page via the fragment."""
+        first, second = tmp_path / "a.mp4", tmp_path / "b c.mp4"
+        first.write_bytes(b"")
+        second.write_bytes(b"")
+        url1 = VideoContent(id=Content.new_id(), source=str(first), footer=False)
+        url2 = VideoContent(id=Content.new_id(), source=str(second), footer=False)
+        page1, frag1 = url1.render_url().split("#")
+        page2, frag2 = url2.render_url().split("#")
+        assert page1 == page2
+        assert unquote(frag2) == second.as_uri()
+        assert "<video" in Path(page1.removeprefix("file://")).read_text()
+
+    def test_footer_is_part_of_the_key(self):
+        """Test that toggling the footer renders the content again."""
+        with_footer = VideoContent(id=Content.new_id(), source="/tmp/video.mp4")
+        without = VideoContent(
+            id=Content.new_id(), source="/tmp/video.mp4", footer=False
         )
-        url = content.to_url()
-        assert url.startswith("data:text/html;charset=utf-8,")
-        assert content.kind == "error"
+        assert with_footer.key != without.key
 
 
 class TestContentBank:
@@ -206,43 +263,145 @@ class TestContentBank:
         idx, content = bank.current()
         assert content.source == "https://test.com"
 
-    def test_diff_detects_added(self):
-        """Test diff detects added content."""
+    def test_urls_are_rendered_once_per_set_of_items(self):
+        """Test urls() is computed once and recomputed after set_items."""
+        first = UrlContent(id=Content.new_id(), source="https://example.com")
+        bank = ContentBank([first])
+        urls = bank.urls()
+        assert urls == ("https://example.com",)
+        assert bank.urls() is urls
+
+        bank.set_items([first, UrlContent(id=Content.new_id(), source="https://b.com")])
+        assert bank.urls() == ("https://example.com", "https://b.com")
+
+    def test_set_items_drops_rendered_urls_of_removed_items(self):
+        """Test set_items re-renders content that was removed and added back."""
+        kept = ErrorContent(id=Content.new_id(), source="kept")
+        removed = ErrorContent(id=Content.new_id(), source="removed")
+        bank = ContentBank([kept, removed])
+        kept_url, removed_url = kept.render_url(), removed.render_url()
+
+        bank.set_items([kept])
+
+        assert kept.render_url() == kept_url
+        assert removed.render_url() != removed_url
+
+    @pytest.mark.parametrize(
+        "items1,items2,expected_key,expected_value",
+        [
+            pytest.param(
+                [("https://example.com", 10)],
+                [("https://example.com", 10), ("https://new.com", 20)],
+                "added",
+                [1],
+                id="added",
+            ),
+            pytest.param(
+                [("https://example.com", 10), ("https://old.com", 20)],
+                [("https://example.com", 10)],
+                "removed",
+                [1],
+                id="removed",
+            ),
+            pytest.param(
+                [("https://example.com", 10)],
+                [("https://example.com", 20)],
+                "modified",
+                [(0, 0)],
+                id="modified",
+            ),
+        ],
+    )
+    def test_diff(self, items1, items2, expected_key, expected_value):
+        """Test diff reports each kind of change, and only that change."""
+
+        def load(pairs):
+            return [
+                UrlContent(id=Content.new_id(), source=source, duration=duration)
+                for source, duration in pairs
+            ]
+
+        bank = ContentBank(load(items1))
+        diff = bank.diff(load(items2))
+        expected = {"removed": [], "added": [], "modified": []}
+        expected[expected_key] = expected_value
+        assert diff == expected
+
+    def test_diff_pairs_repeated_items_by_occurrence(self):
+        """Test a repeated item is only added/removed when its count changes."""
+
+        def load(*sources):
+            return [UrlContent(id=Content.new_id(), source=s) for s in sources]
+
+        bank = ContentBank(load("https://a.com", "https://a.com", "https://b.com"))
+        diff = bank.diff(load("https://a.com", "https://b.com"))
+        assert diff == {"removed": [1], "added": [], "modified": []}
+
+        bank = ContentBank(load("https://a.com", "https://b.com"))
+        diff = bank.diff(load("https://b.com", "https://a.com", "https://a.com"))
+        assert diff == {"removed": [], "added": [2], "modified": []}
+
+    def test_diff_of_unchanged_items_is_empty(self):
+        """Test diff reports nothing when a reload yields the same items."""
+
+        def load():
+            # Every config load assigns fresh ids
+            return [
+                UrlContent(id=Content.new_id(), source="https://a.com", duration=10),
+                ImageContent(id=Content.new_id(), source="/tmp/b.png"),
+            ]
+
+        bank = ContentBank(load())
+        diff = bank.diff(load())
+        assert diff == {"removed": [], "added": [], "modified": []}
+
+    def test_diff_detects_mixed_changes(self):
+        """Test diff reports added, removed and modified items in one pass."""
         items1 = [
-            UrlContent(id=Content.new_id(), source="https://example.com", duration=10)
+            UrlContent(id=Content.new_id(), source="https://a.com", duration=10),
+            UrlContent(id=Content.new_id(), source="https://b.com", duration=10),
+            ImageContent(id=Content.new_id(), source="/tmp/c.png", duration=10),
         ]
         items2 = [
-            UrlContent(id=Content.new_id(), source="https://example.com", duration=10),
-            UrlContent(id=Content.new_id(), source="https://new.com", duration=20),
+            VideoContent(id=Content.new_id(), source="/tmp/c.png", duration=10),
+            UrlContent(id=Content.new_id(), source="https://b.com", duration=15),
+            UrlContent(id=Content.new_id(), source="https://d.com", duration=10),
         ]
         bank = ContentBank(items1)
         diff = bank.diff(items2)
-        assert len(diff["added"]) == 1
-        assert diff["added"][0] == 1
+        # A changed type is a different item, not a modification
+        assert sorted(diff["removed"]) == [0, 2]
+        assert diff["added"] == [0, 2]
+        assert diff["modified"] == [(1, 1)]
 
-    def test_diff_detects_removed(self):
-        """Test diff detects removed content."""
-        items1 = [
-            UrlContent(id=Content.new_id(), source="https://example.com", duration=10),
-            UrlContent(id=Content.new_id(), source="https://old.com", duration=20),
-        ]
-        items2 = [
-            UrlContent(id=Content.new_id(), source="https://example.com", duration=10)
-        ]
-        bank = ContentBank(items1)
-        diff = bank.diff(items2)
-        assert len(diff["removed"]) == 1
-        assert diff["removed"][0] == 1
 
-    def test_diff_detects_modified(self):
-        """Test diff detects modified content."""
-        items1 = [
-            UrlContent(id=Content.new_id(), source="https://example.com", duration=10)
-        ]
-        items2 = [
-            UrlContent(id=Content.new_id(), source="https://example.com", duration=20)
-        ]
-        bank = ContentBank(items1)
-        diff = bank.diff(items2)
-        assert len(diff["modified"]) == 1
-        assert diff["modified"][0] == (0, 0)
+def _url_items(start: int, count: int = 1000) -> list[UrlContent]:
+    return [
+        UrlContent(id=str(i), source=f"https://s{i}.com", duration=10)
+        for i in range(start, start + count)
+    ]
+
+
+def test_diff_scales_linearly(monkeypatch):
+    """Test diff looks at each item a bounded number of times.
+
+    Runs by default and fails on an O(n*m) diff: a nested scan over these
+    2000-item lists reads item keys millions of times, a linear one ~4n.
+    """
+    old_items, new_items = _url_items(0, 2000), _url_items(1, 2000)
+    bank = ContentBank(old_items)
+    reads = 0
+    key = Content.key
+
+    def counting_key(self):
+        nonlocal reads
+        reads += 1
+        return key.fget(self)
+
+    monkeypatch.setattr(Content, "key", property(counting_key))
+    diff = bank.diff(new_items)
+
+    assert diff["added"] == [1999]
+    assert diff["removed"] == [0]
+    assert reads <= 4 * len(new_items)
+
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import os
+from unittest.mock import patch
 
 import pytest
 
 from info_berry.client.display import Display
+from tests._stubs import FakePage
+
+_LOAD = {"wait_until": "domcontentloaded", "timeout": 30000}
 
 
 class TestDisplay:
@@ -29,143 +33,127 @@ class TestDisplay:
         assert display.rotation is None
 
     @pytest.mark.asyncio
-    async def test_launch_creates_browser(self):
+    async def test_launch_creates_browser(self, launched_display):
         """Test launch creates browser and context."""
-        display = Display()
+        _, mocks = launched_display
 
-        mock_playwright = MagicMock()
-        mock_browser = MagicMock()
-        mock_context = MagicMock()
+        assert len(mocks.pw.playwright.chromium.launches) == 1
+        assert len(mocks.pw.browser.contexts) == 1
 
-        # Set up async context manager for async_playwright()
-        async_pw_instance = MagicMock()
-        async_pw_instance.start = AsyncMock(return_value=mock_playwright)
+    @pytest.mark.asyncio
+    @patch("info_berry.client.display._SYSTEM", "Linux")
+    async def test_launch_on_linux_sets_display(self, display_mocks):
+        """Test launch sets DISPLAY environment variable on Linux."""
+        display = Display(screen=":1")
 
-        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_playwright.stop = AsyncMock()
+        await display.launch()
 
-        with patch(
-            "info_berry.client.display.async_playwright", return_value=async_pw_instance
-        ):
-            with patch(
-                "info_berry.client.display.platform.system", return_value="Darwin"
-            ):
-                await display.launch()
+        assert os.environ["DISPLAY"] == ":1"
+        # Screen blanking is disabled with a single xset invocation
+        display_mocks.run.assert_called_once_with(
+            ["xset", "-dpms", "s", "off", "s", "noblank"], check=False
+        )
 
-        mock_playwright.chromium.launch.assert_called_once()
-        mock_browser.new_context.assert_called_once()
+    @patch("info_berry.client.display._SYSTEM", "Linux")
+    def test_apply_rotation_runs_xrandr_on_linux(self, display_mocks):
+        """Test apply_rotation rotates the output and resets it for None."""
+        display = Display(rotation="left")
 
-    @pytest.mark.asyncio
-    async def test_launch_on_linux_sets_display(self):
-        """Test launch sets DISPLAY environment variable on Linux."""
-        display = Display(screen=":1")
+        display.apply_rotation(None)
 
-        mock_playwright = MagicMock()
-        mock_browser = MagicMock()
-        mock_context = MagicMock()
-
-        async_pw_instance = MagicMock()
-        async_pw_instance.start = AsyncMock(return_value=mock_playwright)
-
-        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_playwright.stop = AsyncMock()
-
-        with patch(
-            "info_berry.client.display.async_playwright", return_value=async_pw_instance
-        ):
-            with patch(
-                "info_berry.client.display.platform.system", return_value="Linux"
-            ):
-                with patch("info_berry.client.display.subprocess.run"):
-                    with patch.dict(
-                        "info_berry.client.display.os.environ", {}, clear=True
-                    ):
-                        await display.launch()
-                        assert display.screen == ":1"
+        assert display.rotation is None
+        display_mocks.run.assert_called_once_with(
+            ["xrandr", "--output", "HDMI-1", "--rotate", "normal"], check=False
+        )
 
-    @pytest.mark.asyncio
-    async def test_ensure_pages_creates_pages(self):
-        """Test ensure_pages creates correct number of pages."""
+    @patch("info_berry.client.display._SYSTEM", "Linux")
+    def test_apply_rotation_skips_unchanged_rotation(self, display_mocks):
+        """Test apply_rotation only runs xrandr when the rotation changes."""
         display = Display()
 
-        mock_playwright = MagicMock()
-        mock_browser = MagicMock()
-        mock_context = MagicMock()
-
-        # Create unique mock pages
-        mock_page1 = MagicMock()
-        mock_page2 = MagicMock()
+        display.apply_rotation("left")
+        display.apply_rotation("left")
+        display.screen = ":1"
+        display.apply_rotation("left")
 
-        async_pw_instance = MagicMock()
-        async_pw_instance.start = AsyncMock(return_value=mock_playwright)
+        # Once for :0 and once for the newly selected :1
+        assert display_mocks.run.call_count == 2
 
-        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_playwright.stop = AsyncMock()
+    @pytest.mark.asyncio
+    @patch("info_berry.client.display._SYSTEM", "Linux")
+    async def test_relaunch_resets_removed_rotation(self, display_mocks):
+        """Test a relaunch without rotation un-rotates a previously rotated screen."""
+        display = Display(rotation="left")
+        await display.launch()
+        await display.close()
+
+        # Size and rotation changed in one edit, as on a config reload
+        display_mocks.run.reset_mock()
+        display.width, display.height = 1280, 720
+        display.rotation = None
+        await display.launch()
+
+        display_mocks.run.assert_called_once_with(
+            ["xrandr", "--output", "HDMI-1", "--rotate", "normal"], check=False
+        )
+        assert display._rotations == {":0": None}
 
-        # Set up new_page to return different pages
-        mock_context.new_page = AsyncMock(side_effect=[mock_page1, mock_page2])
-        mock_page1.goto = AsyncMock()
-        mock_page2.goto = AsyncMock()
+    @pytest.mark.asyncio
+    async def test_close_keeps_browser_for_next_launch(self, launched_display):
+        """Test close/launch recycles the context but keeps the browser."""
+        display, mocks = launched_display
+        first_browser = mocks.pw.browser
+
+        await display.close()
+        await display.launch()
+
+        assert mocks.pw.starts == 1
+        assert mocks.pw.playwright.chromium.browsers == [first_browser]
+        assert len(first_browser.contexts) == 2
+        assert first_browser.contexts[0].closes == 1
+        assert first_browser.closes == 0
+
+        # A different X screen needs its own browser
+        display.screen = ":1"
+        await display.close()
+        await display.launch()
+        assert len(mocks.pw.playwright.chromium.browsers) == 2
+        assert first_browser.closes == 1
+
+        await display.shutdown()
+        assert mocks.pw.browser.closes == 1
+        assert mocks.pw.playwright.stops == 1
 
-        with patch(
-            "info_berry.client.display.async_playwright", return_value=async_pw_instance
-        ):
-            with patch(
-                "info_berry.client.display.platform.system", return_value="Darwin"
-            ):
-                await display.launch()
+    @pytest.mark.asyncio
+    async def test_ensure_pages_creates_pages(self, launched_display):
+        """Test ensure_pages creates correct number of pages."""
+        display, mocks = launched_display
 
         urls = ["https://example.com", "https://test.com"]
         await display.ensure_pages(urls)
 
-        # Verify new_page was called twice
-        assert mock_context.new_page.call_count == 2
-        assert mock_page1.goto.call_count == 2
-        assert mock_page2.goto.call_count == 2
-
+        page1, page2 = mocks.pw.context.pages
         # Verify the URLs were set correctly
-        mock_page1.goto.assert_any_call("about:blank")
-        mock_page1.goto.assert_any_call(
-            "https://example.com", wait_until="domcontentloaded", timeout=30000
-        )
-        mock_page2.goto.assert_any_call("about:blank")
-        mock_page2.goto.assert_any_call(
-            "https://test.com", wait_until="domcontentloaded", timeout=30000
-        )
+        assert page1.gotos == [("https://example.com", _LOAD)]
+        assert page2.gotos == [("https://test.com", _LOAD)]
 
     @pytest.mark.asyncio
-    async def test_ensure_pages_removes_extra_pages(self):
-        """Test ensure_pages removes extra pages."""
+    async def test_launch_with_urls_opens_pages(self, display_mocks):
+        """Test launch opens and navigates the initial pages."""
         display = Display()
 
-        mock_playwright = MagicMock()
-        mock_browser = MagicMock()
-        mock_context = MagicMock()
-
-        # Create 3 mock pages
-        mock_pages = [MagicMock() for _ in range(3)]
-        for page in mock_pages:
-            page.goto = AsyncMock()
-            page.close = AsyncMock()
-
-        async_pw_instance = MagicMock()
-        async_pw_instance.start = AsyncMock(return_value=mock_playwright)
+        urls = ["https://example.com", "https://test.com"]
+        await display.launch(urls)
 
-        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_playwright.stop = AsyncMock()
-        mock_context.new_page = AsyncMock(side_effect=mock_pages)
+        page1, page2 = display_mocks.pw.context.pages
+        assert page1.gotos[-1] == ("https://example.com", _LOAD)
+        assert page2.gotos[-1] == ("https://test.com", _LOAD)
+        assert display._order == urls
 
-        with patch(
-            "info_berry.client.display.async_playwright", return_value=async_pw_instance
-        ):
-            with patch(
-                "info_berry.client.display.platform.system", return_value="Darwin"
-            ):
-                await display.launch()
+    @pytest.mark.asyncio
+    async def test_ensure_pages_removes_extra_pages(self, launched_display):
+        """Test ensure_pages removes extra pages."""
+        display, mocks = launched_display
 
         # Create 3 pages
         await display.ensure_pages(["url1", "url2", "url3"])
@@ -173,57 +161,90 @@ class TestDisplay:
         await display.ensure_pages(["url1"])
 
         # Should close 2 pages
-        assert mock_pages[1].close.call_count == 1
-        assert mock_pages[2].close.call_count == 1
+        assert [p.closes for p in mocks.pw.pages] == [0, 1, 1]
 
     @pytest.mark.asyncio
-    async def test_show_brings_page_to_front(self):
-        """Test show brings specified page to front."""
-        display = Display()
+    async def test_ensure_pages_retries_failed_navigation(self, launched_display):
+        """Test a failed navigation does not stop other pages and is retried."""
+        display, mocks = launched_display
+
+        page1 = FakePage(goto_errors=[TimeoutError()])
+        mocks.pw.queued.append(page1)
 
-        mock_playwright = MagicMock()
-        mock_browser = MagicMock()
-        mock_context = MagicMock()
-        mock_page = MagicMock()
-
-        async_pw_instance = MagicMock()
-        async_pw_instance.start = AsyncMock(return_value=mock_playwright)
-
-        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_playwright.stop = AsyncMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-        mock_page.goto = AsyncMock()
-        mock_page.bring_to_front = AsyncMock()
-
-        with patch(
-            "info_berry.client.display.async_playwright", return_value=async_pw_instance
-        ):
-            with patch(
-                "info_berry.client.display.platform.system", return_value="Darwin"
-            ):
-                await display.launch()
+        # First page times out, second still loads
+        await display.ensure_pages(["url1", "url2"])
+        page2 = mocks.pw.pages[1]
+        assert page2.gotos[-1] == ("url2", _LOAD)
+
+        # Only the failed page is navigated again
+        await display.ensure_pages(["url1", "url2"])
+        assert page1.gotos == [("url1", _LOAD), ("url1", _LOAD)]
+        assert len(page2.gotos) == 1
 
+    @pytest.mark.asyncio
+    async def test_ensure_pages_keeps_pool_when_new_page_fails(self, launched_display):
+        """Test a failed page creation leaves the existing pages in place."""
+        display, mocks = launched_display
         await display.ensure_pages(["url1", "url2"])
+        page1, page2 = mocks.pw.pages
+        context = mocks.pw.context
+        new_page = context.new_page
+
+        async def failing_new_page():
+            raise RuntimeError("browser gone")
+
+        context.new_page = failing_new_page
+        with pytest.raises(RuntimeError):
+            await display.ensure_pages(["url3", "url4", "url5"])
+
+        assert display._pages == {"url1": page1, "url2": page2}
+        assert display._order == ["url1", "url2"]
+        assert page1.closes == page2.closes == 0
         await display.show(1)
+        assert page2.fronts == 1
 
-        mock_page.bring_to_front.assert_called()
+        # Recovering recycles both pages and opens only the one missing page
+        context.new_page = new_page
+        await display.ensure_pages(["url3", "url4", "url5"])
+        assert len(mocks.pw.pages) == 3
 
     @pytest.mark.asyncio
-    async def test_reload_reloads_page(self):
-        """Test reload reloads specified page."""
-        display = Display()
+    async def test_ensure_pages_reuses_pages_on_reorder(self, launched_display):
+        """Test reordering and replacing URLs reuses pages instead of reloading."""
+        display, mocks = launched_display
 
-        mock_playwright = MagicMock()
-        mock_browser = MagicMock()
-        mock_context = MagicMock()
-        mock_page = MagicMock()
+        await display.ensure_pages(["url1", "url2"])
+        page1, page2 = mocks.pw.pages
 
-        async_pw_instance = MagicMock()
-        async_pw_instance.start = AsyncMock(return_value=mock_playwright)
+        # Swapping the order navigates nothing
+        await display.ensure_pages(["url2", "url1"])
+        assert len(page1.gotos) == 1
+        assert len(page2.gotos) == 1
+        await display.show(0)
+        assert page2.fronts == 1
+
+        # A replaced URL is loaded into the page that is no longer needed
+        await display.ensure_pages(["url2", "url3"])
+        assert mocks.pw.pages == [page1, page2]
+        assert page1.gotos[-1] == ("url3", _LOAD)
+        assert page1.closes == 0
+
+    @pytest.mark.asyncio
+    async def test_show_brings_page_to_front(self, launched_display):
+        """Test show brings specified page to front."""
+        display, mocks = launched_display
+
+        await display.ensure_pages(["url1", "url2"])
+        await display.show(1)
+
+        assert [p.fronts for p in mocks.pw.pages] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_reload_reloads_page(self, launched_display):
+        """Test reload reloads specified page."""
+        display, mocks = launched_display
+
+        await display.ensure_pages(["url1", "url2"])
+        await display.reload(1)
 
-        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_playwright.stop = AsyncMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-        mock_page.goto
+        assert [p.reloads for p in mocks.pw.pages] == [[], [_LOAD]]
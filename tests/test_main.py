@@ -40,7 +40,7 @@ class TestAmain:
     """Tests for _amain function."""
 
     @pytest.mark.asyncio
-    async def test_amain_creates_player(self, temp_config_file: Path):
+    async def test_amain_creates_player(self, baseline_config_file: Path):
         """Test _amain creates and runs player."""
         with patch("info_berry.client.main.Player") as MockPlayer:
             mock_player = MagicMock()
@@ -55,14 +55,14 @@ class TestAmain:
             mock_player.run.side_effect = stop_immediately
 
             try:
-                await _amain(str(temp_config_file))
+                await _amain(str(baseline_config_file))
             except Exception:
                 pass
 
-            MockPlayer.assert_called_once_with(config_file=str(temp_config_file))
+            MockPlayer.assert_called_once_with(config_file=str(baseline_config_file))
 
     @pytest.mark.asyncio
-    async def test_amain_handles_signal(self, temp_config_file: Path):
+    async def test_amain_handles_signal(self, baseline_config_file: Path):
         """Test _amain sets up signal handlers."""
         with patch("info_berry.client.main.Player") as MockPlayer:
             mock_player = MagicMock()
@@ -80,7 +80,7 @@ class TestAmain:
                 mock_player.run.side_effect = stop_immediately
 
                 try:
-                    await _amain(str(temp_config_file))
+                    await _amain(str(baseline_config_file))
                 except Exception:
                     pass
 
@@ -91,25 +91,25 @@ class TestAmain:
 class TestMain:
     """Tests for main function."""
 
-    def test_main_parses_args(self, temp_config_file: Path):
+    def test_main_parses_args(self, baseline_config_file: Path):
         """Test main parses arguments."""
-        test_args = ["-c", str(temp_config_file)]
+        test_args = ["-c", str(baseline_config_file)]
         with patch.object(sys, "argv", ["main.py"] + test_args):
             with patch("asyncio.run") as mock_run:
                 main()
                 mock_run.assert_called_once()
 
-    def test_main_handles_keyboard_interrupt(self, temp_config_file: Path):
+    def test_main_handles_keyboard_interrupt(self, baseline_config_file: Path):
         """Test main handles KeyboardInterrupt gracefully."""
-        test_args = ["-c", str(temp_config_file)]
+        test_args = ["-c", str(baseline_config_file)]
         with patch.object(sys, "argv", ["main.py"] + test_args):
             with patch("asyncio.run", side_effect=KeyboardInterrupt):
                 # Should not raise exception
                 main()
 
-    def test_main_configures_logging(self, temp_config_file: Path):
+    def test_main_configures_logging(self, baseline_config_file: Path):
         """Test main configures logging."""
-        test_args = ["-c", str(temp_config_file), "--log-level", "DEBUG"]
+        test_args = ["-c", str(baseline_config_file), "--log-level", "DEBUG"]
         with patch.object(sys, "argv", ["main.py"] + test_args):
             with patch("logging.basicConfig") as mock_logging:
                 with patch("asyncio.run"):
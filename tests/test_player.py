@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-import yaml
 
 from info_berry.client.player import Player
 
@@ -15,30 +15,25 @@ from info_berry.client.player import Player
 class TestPlayer:
     """Tests for Player class."""
 
-    def test_initialization(self, temp_config_file: Path):
+    def test_initialization(self, memory_config: dict):
         """Test Player initialization."""
-        player = Player(config_file=str(temp_config_file))
-        assert player.config_file == str(temp_config_file)
+        player = Player(config_file="memory-config.yaml")
+        assert player.config_file == "memory-config.yaml"
         assert len(player._bank.items()) == 3
 
     @pytest.mark.asyncio
-    async def test_run_launches_display(self, temp_config_file: Path):
+    async def test_run_launches_display(self, memory_config: dict):
         """Test run launches display."""
-        player = Player(config_file=str(temp_config_file))
+        player = Player(config_file="memory-config.yaml")
 
         # Track if display methods were called
-        launch_called = False
-        ensure_pages_called = False
+        launched_urls = None
 
-        async def mock_launch():
-            nonlocal launch_called
-            launch_called = True
-
-        async def mock_ensure_pages(urls):
-            nonlocal ensure_pages_called
-            ensure_pages_called = True
+        async def mock_launch(urls=None):
+            nonlocal launched_urls
+            launched_urls = urls
 
-        async def mock_close():
+        async def mock_shutdown():
             pass
 
         # Create mock coroutines for the loops
@@ -47,8 +42,7 @@ class TestPlayer:
             await player._shutdown.wait()
 
         player._display.launch = mock_launch
-        player._display.ensure_pages = mock_ensure_pages
-        player._display.close = mock_close
+        player._display.shutdown = mock_shutdown
 
         # Patch create_task to not actually start the loops
         original_create_task = asyncio.create_task
@@ -77,22 +71,22 @@ class TestPlayer:
                     except asyncio.CancelledError:
                         pass
 
-            assert launch_called
-            assert ensure_pages_called
+            # Pages are opened as part of the launch
+            assert launched_urls == player._bank.urls()
 
     @pytest.mark.asyncio
-    async def test_stop_sets_shutdown_event(self, temp_config_file: Path):
+    async def test_stop_sets_shutdown_event(self, memory_config: dict):
         """Test stop sets shutdown event."""
-        player = Player(config_file=str(temp_config_file))
+        player = Player(config_file="memory-config.yaml")
         assert not player._shutdown.is_set()
 
         await player.stop()
         assert player._shutdown.is_set()
 
     @pytest.mark.asyncio
-    async def test_cleanup_cancels_tasks(self, temp_config_file: Path):
+    async def test_cleanup_cancels_tasks(self, memory_config: dict):
         """Test cleanup cancels all tasks."""
-        player = Player(config_file=str(temp_config_file))
+        player = Player(config_file="memory-config.yaml")
 
         # Create real async task
         async def dummy():
@@ -104,19 +98,19 @@ class TestPlayer:
         task = asyncio.create_task(dummy())
         player._tasks["test"] = task
 
-        async def mock_close():
+        async def mock_shutdown():
             pass
 
-        player._display.close = mock_close
+        player._display.shutdown = mock_shutdown
 
         await player.cleanup()
 
         assert task.cancelled()
 
     @pytest.mark.asyncio
-    async def test_rotate_loop_shows_content(self, temp_config_file: Path):
+    async def test_rotate_loop_shows_content(self, memory_config: dict):
         """Test rotate loop shows content."""
-        player = Player(config_file=str(temp_config_file))
+        player = Player(config_file="memory-config.yaml")
 
         show_called = False
 
@@ -129,25 +123,24 @@ class TestPlayer:
         # Run one iteration
         iteration_count = 0
 
-        async def mock_wait_for(event_wait, timeout):
+        async def mock_sleep(seconds):
             nonlocal iteration_count
             iteration_count += 1
             if iteration_count >= 2:
                 player._shutdown.set()
-            raise asyncio.TimeoutError()
 
-        with patch("asyncio.wait_for", side_effect=mock_wait_for):
-            try:
-                await player._rotate_loop()
-            except Exception:
-                pass
+        player._sleep = mock_sleep
+        try:
+            await player._rotate_loop()
+        except Exception:
+            pass
 
         assert show_called
 
     @pytest.mark.asyncio
-    async def test_reload_config_updates_content(self, temp_config_file: Path):
+    async def test_reload_config_updates_content(self, memory_config: dict):
         """Test config reload updates content."""
-        player = Player(config_file=str(temp_config_file))
+        player = Player(config_file="memory-config.yaml")
 
         # Modify config
         new_config = {
@@ -157,7 +150,8 @@ class TestPlayer:
                 {"type": "url", "source": "https://new-url.com", "duration": 10}
             ],
         }
-        temp_config_file.write_text(yaml.dump(new_config))
+        memory_config.clear()
+        memory_config.update(new_config)
 
         async def mock_ensure_pages(urls):
             pass
@@ -170,11 +164,48 @@ class TestPlayer:
         assert player._bank.items()[0].source == "https://new-url.com"
 
     @pytest.mark.asyncio
-    async def test_reload_config_restarts_display_if_changed(
-        self, temp_config_file: Path
+    async def test_reload_config_skips_pages_for_duration_changes(
+        self, memory_config: dict
     ):
+        """Test a duration-only change updates the bank without touching pages."""
+        player = Player(config_file="memory-config.yaml")
+        player._shown_urls = player._bank.urls()  # as after run()
+
+        for item in memory_config["content"]:
+            item["duration"] += 5
+
+        player._display.ensure_pages = AsyncMock()
+
+        await player._reload_config()
+
+        player._display.ensure_pages.assert_not_called()
+        assert player._bank.items()[0].duration == 15
+
+    @pytest.mark.asyncio
+    async def test_reload_config_shows_media_once_it_exists(
+        self, memory_config: dict, tmp_path: Path
+    ):
+        """Test a reload replaces the error page of media that appeared since."""
+        image = tmp_path / "late.png"
+        memory_config["content"] = [
+            {"type": "image", "source": str(image), "footer": False}
+        ]
+        player = Player(config_file="memory-config.yaml")
+        player._shown_urls = player._bank.urls()  # as after run()
+        assert player._shown_urls != (image.as_uri(),)
+
+        image.write_bytes(b"")
+        player._display.ensure_pages = AsyncMock()
+
+        # Same config again: the keys are unchanged, but the URL is not
+        await player._reload_config()
+
+        player._display.ensure_pages.assert_awaited_once_with((image.as_uri(),))
+
+    @pytest.mark.asyncio
+    async def test_reload_config_restarts_display_if_changed(self, memory_config: dict):
         """Test display restart when display config changes."""
-        player = Player(config_file=str(temp_config_file))
+        player = Player(config_file="memory-config.yaml")
 
         # Change display config
         new_config = {
@@ -182,7 +213,8 @@ class TestPlayer:
             "behavior": {"rotation_interval": 30},
             "content": [{"type": "url", "source": "https://example.com"}],
         }
-        temp_config_file.write_text(yaml.dump(new_config))
+        memory_config.clear()
+        memory_config.update(new_config)
 
         close_called = False
         launch_called = False
@@ -191,54 +223,174 @@ class TestPlayer:
             nonlocal close_called
             close_called = True
 
-        async def mock_launch():
+        async def mock_launch(urls=None):
             nonlocal launch_called
-            launch_called = True
-
-        async def mock_ensure_pages(urls):
-            pass
+            launch_called = urls == ("https://example.com",)
 
         player._display.close = mock_close
         player._display.launch = mock_launch
-        player._display.ensure_pages = mock_ensure_pages
+        player._display.ensure_pages = AsyncMock()
 
         await player._reload_config()
 
         assert close_called
         assert launch_called
+        player._display.ensure_pages.assert_not_called()
+        assert player._display.screen == ":1"
+        assert player._display.width == 1280
+        assert player._display.height == 720
 
     @pytest.mark.asyncio
-    @pytest.mark.slow
-    async def test_config_watch_loop_detects_changes(self, temp_config_file: Path):
-        """Test config watch loop detects file changes."""
-        player = Player(config_file=str(temp_config_file))
+    async def test_reload_config_rotates_without_relaunch(self, memory_config: dict):
+        """Test a rotation-only change is applied without restarting the display."""
+        player = Player(config_file="memory-config.yaml")
 
-        reload_called = False
+        new_config = {
+            "display": {
+                "screen": ":0",
+                "width": 1920,
+                "height": 1080,
+                "rotation": "left",
+            },
+            "behavior": {"rotation_interval": 30},
+            "content": [{"type": "url", "source": "https://example.com"}],
+        }
+        memory_config.clear()
+        memory_config.update(new_config)
 
-        async def mock_reload_config():
-            nonlocal reload_called
-            reload_called = True
+        async def mock_ensure_pages(urls):
+            pass
+
+        player._display.close = AsyncMock()
+        player._display.launch = AsyncMock()
+        player._display.apply_rotation = MagicMock()
+        player._display.ensure_pages = mock_ensure_pages
+
+        await player._reload_config()
 
-        player._reload_config = mock_reload_config
+        player._display.apply_rotation.assert_called_once_with("left")
+        player._display.close.assert_not_called()
+        player._display.launch.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_config_watch_loop_detects_changes(self, memory_config: dict):
+        """Test config watch loop detects file changes."""
+        player = Player(config_file="memory-config.yaml")
+        player._reload_config = AsyncMock()
+
+        changed = (100, 10, 1)
+        stamps = iter([None, changed, changed])
+        player._stamp = lambda path: next(stamps, changed)
+        player._last_stamp = (50, 10, 1)
         iterations = 0
-        original_sleep = asyncio.sleep
 
         async def controlled_sleep(duration):
             nonlocal iterations
             iterations += 1
-            if iterations == 1:
-                # First iteration: modify file
-                temp_config_file.touch()
-                player._last_mtime = 0  # Force change detection
-                await original_sleep(0.001)
-            else:
-                # Stop after check
+            if iterations == 4:
+                player._shutdown.set()
+
+        player._sleep = controlled_sleep
+        with patch("info_berry.client.player.awatch", None):
+            await player._config_watch_loop()
+
+        # Missing file is skipped, the new stamp is settled and reloaded once
+        player._reload_config.assert_awaited_once()
+        assert player._last_stamp == changed
+
+    @pytest.mark.asyncio
+    async def test_config_watch_loop_coalesces_bursts(self, temp_config_file: Path):
+        """Test several quick writes to the config file cause one reload."""
+        player = Player(config_file=str(temp_config_file))
+        player._reload_config = AsyncMock()
+        base = temp_config_file.stat().st_mtime
+        sleeps = 0
+
+        async def controlled_sleep(duration):
+            nonlocal sleeps
+            sleeps += 1
+            if sleeps <= 3:
+                # Three saves in a row, each bumping the mtime
+                os.utime(temp_config_file, (base + sleeps, base + sleeps))
+            elif sleeps == 5:
+                player._shutdown.set()
+
+        player._sleep = controlled_sleep
+        with patch("info_berry.client.player.awatch", None):
+            await player._config_watch_loop()
+
+        player._reload_config.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_config_watch_loop_uses_file_notifications(
+        self, baseline_config_file: Path
+    ):
+        """Test change notifications for the config file trigger a reload."""
+        player = Player(config_file=str(baseline_config_file))
+        player._reload_config = AsyncMock()
+        config_path = str(baseline_config_file.resolve())
+
+        async def fake_awatch(path, stop_event, recursive, watch_filter):
+            assert Path(path) == baseline_config_file.resolve().parent
+            assert recursive is False
+            batches = [
+                {(2, str(baseline_config_file.parent / "other.yaml"))},
+                {(2, config_path), (1, config_path)},
+            ]
+            # Like watchfiles: drop filtered changes and yield non-empty batches
+            for batch in batches:
+                changes = {(c, p) for c, p in batch if watch_filter(c, p)}
+                if changes:
+                    yield changes
+
+        with patch("info_berry.client.player.awatch", fake_awatch):
+            await player._config_watch_loop()
+
+        player._reload_config.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sleep_returns_early_on_shutdown(self, memory_config: dict):
+        """Test _sleep wakes up as soon as shutdown is requested."""
+        player = Player(config_file="memory-config.yaml")
+        player._shutdown.set()
+
+        await asyncio.wait_for(player._sleep(60), timeout=1)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("has_timeout", [True, False])
+    async def test_sleep_times_out(self, memory_config: dict, has_timeout: bool):
+        """Test _sleep returns after the delay on both asyncio code paths."""
+        if has_timeout and not hasattr(asyncio, "timeout"):
+            pytest.skip("asyncio.timeout() needs Python 3.11+")
+        player = Player(config_file="memory-config.yaml")
+
+        with patch("info_berry.client.player._HAS_ASYNCIO_TIMEOUT", has_timeout):
+            await asyncio.wait_for(player._sleep(0.01), timeout=1)
+
+        assert not player._shutdown.is_set()
+
+    @pytest.mark.asyncio
+    async def test_poll_detects_file_replaced_by_rename(self, temp_config_file: Path):
+        """Test a save that renames a new file into place is picked up."""
+        player = Player(config_file=str(temp_config_file))
+        player._reload_config = AsyncMock()
+        stamp = temp_config_file.stat()
+        sleeps = 0
+
+        async def controlled_sleep(duration):
+            nonlocal sleeps
+            sleeps += 1
+            if sleeps == 1:
+                # Same size and mtime, but a different file (inode)
+                new_file = temp_config_file.with_suffix(".new")
+                new_file.write_bytes(temp_config_file.read_bytes())
+                os.utime(new_file, ns=(stamp.st_atime_ns, stamp.st_mtime_ns))
+                os.replace(new_file, temp_config_file)
+            elif sleeps == 3:
                 player._shutdown.set()
-                await original_sleep(0.001)
 
-        with patch("asyncio.sleep", side_effect=controlled_sleep):
+        player._sleep = controlled_sleep
+        with patch("info_berry.client.player.awatch", None):
             await player._config_watch_loop()
 
-        # Verify mechanism works
-        assert iterations >= 1
+        player._reload_config.assert_awaited_once()